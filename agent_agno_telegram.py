@@ -38,6 +38,7 @@ from telegram.ext import (
 
 from customTools.PokemonApiTools import PokemonApiTools
 from functions.SanitizarStringContent import sanitizar_string_para_log
+from functions.TimeoutTools import tornar_toolkit_assincrono
 
 # === 2. CONFIGURAÇÃO DE LOGGING ===
 
@@ -74,6 +75,9 @@ GOOGLE_LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION")
 # Nota: Isso é usado pela *ferramenta* (Agno), não pelo bot em si.
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
+# Tempo máximo (em segundos) de cada chamada de ferramenta do agente
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "20"))
+
 # --- Validação das Variáveis Críticas ---
 
 if not TELEGRAM_TOKEN:
@@ -138,7 +142,16 @@ tools_list.append(YFinanceTools())
 logger.info("Ferramenta YFinance (Cotações) adicionada.")
 
 #4. Ferramenta de Pokémon (API personalizada)
-tools_list.append(PokemonApiTools())
+# async_mode=True: usa a versão assíncrona (httpx), executada com agent.arun()
+tools_list.append(PokemonApiTools(async_mode=True))
+
+# 5. Tempo limite por chamada de ferramenta
+# Com agent.arun() (ver handle_message), o Agno já executa as chamadas independentes
+# de um mesmo turno em paralelo, então o tempo do turno se aproxima da ferramenta mais
+# lenta, e não da soma de todas. Aqui cada tool ganha um entrypoint assíncrono com
+# tempo limite, para que uma ferramenta travada não segure a resposta inteira.
+for toolkit in tools_list:
+    tornar_toolkit_assincrono(toolkit, TOOL_TIMEOUT_SECONDS)
 
 # === 6. CONFIGURAÇÃO DO AGENTE (AGNO) ===
 
@@ -204,8 +217,9 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
 
         # 1. Executa o agente com o texto do usuário
-        #    'agent.run()' retorna um objeto RunOutput
-        run_output = agent.run(user_text)
+        #    'agent.arun()' retorna um objeto RunOutput e executa as
+        #    ferramentas de forma concorrente, sem bloquear o event loop do bot
+        run_output = await agent.arun(user_text)
 
         # 2. Extrai a string de texto final da propriedade .content
         response_text = run_output.content
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Verificação de tempo das tools assíncronas (functions/TimeoutTools.py)
+
+Simula um turno do modelo com várias chamadas de tools independentes e as executa
+pelo mesmo caminho que o Agno usa em `agent.arun()` (Model.arun_function_call +
+asyncio.gather). Não faz chamadas de rede nem precisa de chaves de API.
+
+Verifica que:
+1. Com `agent.arun()`, o Agno já executa tools síncronas independentes em paralelo
+   (tempo do turno ~ tool mais lenta), sem bloquear o event loop do bot.
+2. As variantes de `tornar_toolkit_assincrono` mantêm esse comportamento.
+3. O tempo limite por chamada é respeitado e retorna uma mensagem de erro.
+"""
+
+import asyncio
+import time
+
+from agno.models.base import Model
+from agno.tools import Toolkit
+from agno.tools.function import FunctionCall
+
+from functions.TimeoutTools import tornar_toolkit_assincrono
+
+
+def consultar_lento(consulta: str) -> str:
+    """Tool síncrona de teste que demora 1 segundo."""
+    time.sleep(1)
+    return f"resultado: {consulta}"
+
+
+def consultar_travado(consulta: str) -> str:
+    """Tool síncrona de teste que demora 3 segundos."""
+    time.sleep(3)
+    return f"resultado: {consulta}"
+
+
+async def executar_turno(toolkits: list[Toolkit], consultas: list[str]) -> tuple[float, list, int]:
+    """
+    Executa uma chamada por toolkit, concorrentemente, e retorna
+    (tempo do turno, resultados, ticks do event loop durante o turno).
+    """
+    chamadas = []
+    for toolkit, consulta in zip(toolkits, consultas):
+        for funcao in toolkit.functions.values():
+            funcao.process_entrypoint()
+            chamadas.append(FunctionCall(function=funcao, arguments={"consulta": consulta}))
+
+    ticks = 0
+    executando = True
+
+    async def contar_ticks():
+        nonlocal ticks
+        while executando:
+            ticks += 1
+            await asyncio.sleep(0.1)
+
+    contador = asyncio.create_task(contar_ticks())
+    inicio = time.perf_counter()
+    # O método não usa o estado do modelo, então não é preciso instanciar um LLM
+    saidas = await asyncio.gather(*(Model.arun_function_call(None, chamada) for chamada in chamadas))
+    duracao = time.perf_counter() - inicio
+    executando = False
+    await contador
+
+    return duracao, [saida[2].result for saida in saidas], ticks
+
+
+async def main() -> None:
+    timeout_segundos = 0.5
+
+    print("--- Tools síncronas no agent.arun() padrão do Agno (já paralelas) ---")
+    toolkits = [Toolkit(name=f"lento_{i}", tools=[consultar_lento]) for i in range(2)]
+    duracao, resultados, ticks = await executar_turno(toolkits, ["a", "b"])
+    print(f"{duracao:.2f}s {resultados} ticks={ticks}")
+    assert duracao < 1.5, "O Agno não executou as tools síncronas em paralelo."
+    assert ticks >= 8, "O event loop ficou bloqueado durante as tools."
+
+    print("--- Tools síncronas com tempo limite (timeout de 5s, não atingido) ---")
+    toolkits = [tornar_toolkit_assincrono(Toolkit(name=f"lento_{i}", tools=[consultar_lento]), 5) for i in range(2)]
+    duracao, resultados, ticks = await executar_turno(toolkits, ["a", "b"])
+    print(f"{duracao:.2f}s {resultados} ticks={ticks}")
+    assert resultados == ["resultado: a", "resultado: b"], "O tempo limite alterou os resultados."
+    assert duracao < 1.5, "O tempo limite serializou as tools."
+
+    print(f"--- Tool travada com timeout de {timeout_segundos}s ---")
+    toolkits = [
+        tornar_toolkit_assincrono(Toolkit(name="travado", tools=[consultar_travado]), timeout_segundos),
+        tornar_toolkit_assincrono(Toolkit(name="lento", tools=[consultar_lento]), 5),
+    ]
+    duracao, resultados, ticks = await executar_turno(toolkits, ["a", "b"])
+    print(f"{duracao:.2f}s {resultados} ticks={ticks}")
+    assert "excedeu o tempo limite" in resultados[0], "O timeout não foi aplicado."
+    assert duracao < 1.5, "O turno esperou pela tool travada."
+
+    print("OK")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
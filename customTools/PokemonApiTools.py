@@ -1,12 +1,45 @@
 from agno.tools import Toolkit
 from agno.utils.log import log_debug
-from typing import Any, List
+from typing import Any
 
+import httpx
 import requests
 import json
 from pprint import pprint  # Para imprimir o JSON de forma mais legível
 
 
+# Tempo máximo (em segundos) de cada requisição HTTP à PokeAPI
+POKEAPI_TIMEOUT_SECONDS = 10
+
+
+def _converter_pokemon_id(pokemon_id_str: str) -> int | dict[str, str]:
+    """Converte o ID recebido para inteiro, ou retorna o dicionário de erro."""
+    try:
+        return int(pokemon_id_str)
+    except ValueError:
+        print(f"Erro: O ID '{pokemon_id_str}' não é um número inteiro válido.")
+        return {"error": f"ID inválido: '{pokemon_id_str}' não é um inteiro."}
+
+
+def _montar_url_pokemon(pokemon_id: int) -> str:
+    """Constrói a URL da PokeAPI para o ID informado."""
+    url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}/"
+    print(f"Buscando dados em: {url}")
+    return url
+
+
+def _erro_http(pokemon_id: int, http_err: Exception, status_code: int) -> dict[str, str | int]:
+    """Erro específico se o Pokémon não for encontrado (404, 500, etc.)."""
+    print(f"Erro HTTP: {http_err}")
+    return {"error": f"Pokemon com ID {pokemon_id} não encontrado.", "status_code": status_code}
+
+
+def _erro_conexao(err: Exception) -> dict[str, str]:
+    """Erro geral de rede (ex: sem conexão, DNS falhou, timeout)."""
+    print(f"Erro na requisição: {err}")
+    return {"error": f"Erro de conexão: {err}"}
+
+
 def get_pokemon_data(pokemon_id_str: str) -> dict[str, str | int] | dict[str, str] | Any:
     """
     Busca dados de um Pokémon na PokeAPI usando um ID em formato string.
@@ -18,21 +51,17 @@ def get_pokemon_data(pokemon_id_str: str) -> dict[str, str | int] | dict[str, st
         dict: O JSON completo da resposta da API ou um dicionário de erro.
     """
 
-    # 1. Tenta converter a string de entrada para um número inteiro
-    try:
-        pokemon_id = int(pokemon_id_str)
-    except ValueError:
-        print(f"Erro: O ID '{pokemon_id_str}' não é um número inteiro válido.")
-        return {"error": f"ID inválido: '{pokemon_id_str}' não é um inteiro."}
-
-    # 2. Constrói a URL final usando uma f-string
-    url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}/"
+    # 1. Converte a string de entrada para um número inteiro
+    pokemon_id = _converter_pokemon_id(pokemon_id_str)
+    if isinstance(pokemon_id, dict):
+        return pokemon_id
 
-    print(f"Buscando dados em: {url}")
+    # 2. Constrói a URL final
+    url = _montar_url_pokemon(pokemon_id)
 
     # 3. Realiza a requisição GET e trata possíveis erros
     try:
-        response = requests.get(url)
+        response = requests.get(url, timeout=POKEAPI_TIMEOUT_SECONDS)
 
         # 4. Verifica se a requisição foi bem-sucedida (status 200)
         # Se for um erro (404, 500, etc.), levanta uma exceção HTTPError
@@ -42,25 +71,54 @@ def get_pokemon_data(pokemon_id_str: str) -> dict[str, str | int] | dict[str, st
         return response.json()
 
     except requests.exceptions.HTTPError as http_err:
-        # Erro específico se o Pokémon não for encontrado (404)
-        print(f"Erro HTTP: {http_err}")
-        return {"error": f"Pokemon com ID {pokemon_id} não encontrado.", "status_code": response.status_code}
+        return _erro_http(pokemon_id, http_err, response.status_code)
     except requests.exceptions.RequestException as err:
-        # Erro geral de rede (ex: sem conexão, DNS falhou)
-        print(f"Erro na requisição: {err}")
-        return {"error": f"Erro de conexão: {err}"}
+        return _erro_conexao(err)
+
+
+async def aget_pokemon_data(pokemon_id_str: str) -> dict[str, str | int] | dict[str, str] | Any:
+    """
+    Busca dados de um Pokémon na PokeAPI usando um ID em formato string.
+
+    Versão assíncrona de `get_pokemon_data`, usando httpx para não bloquear o event loop.
+
+    Argumentos:
+        pokemon_id_str (str): O ID do Pokémon (ex: "25").
+
+    Retorna:
+        dict: O JSON completo da resposta da API ou um dicionário de erro.
+    """
+
+    pokemon_id = _converter_pokemon_id(pokemon_id_str)
+    if isinstance(pokemon_id, dict):
+        return pokemon_id
+
+    url = _montar_url_pokemon(pokemon_id)
+
+    try:
+        async with httpx.AsyncClient(timeout=POKEAPI_TIMEOUT_SECONDS) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
+
+    except httpx.HTTPStatusError as http_err:
+        return _erro_http(pokemon_id, http_err, http_err.response.status_code)
+    except httpx.RequestError as err:
+        return _erro_conexao(err)
 
 
 class PokemonApiTools(Toolkit):
     def __init__(
         self,
+        async_mode: bool = False,
         **kwargs,
     ):
-        tools: List[Any] = [
-            get_pokemon_data
-        ]
+        super().__init__(name="pokemonapi_tools", tools=[get_pokemon_data], **kwargs)
 
-        super().__init__(name="pokemonapi_tools", tools=tools, **kwargs)
+        # async_mode=True troca o entrypoint pela versão assíncrona (httpx), para agentes
+        # executados com `agent.arun()`. O nome da tool continua "get_pokemon_data".
+        if async_mode and "get_pokemon_data" in self.functions:
+            self.functions["get_pokemon_data"].entrypoint = aget_pokemon_data
 
 # --- Exemplo de Uso ---
 
@@ -0,0 +1,72 @@
+import asyncio
+import functools
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from agno.tools import Toolkit
+
+logger = logging.getLogger(__name__)
+
+# Pool dedicado às tools síncronas com tempo limite. Fica separado do executor padrão
+# do asyncio (usado pelo próprio Agno), para que threads presas em tools que excederam
+# o prazo não ocupem os workers das demais chamadas.
+MAX_THREADS_TOOLS = 64
+_executor_tools = ThreadPoolExecutor(max_workers=MAX_THREADS_TOOLS, thread_name_prefix="tools_timeout")
+
+
+def criar_versao_assincrona(funcao: Callable, timeout_segundos: float) -> Callable:
+    """
+        Cria uma variante assíncrona de uma tool, com tempo limite por chamada.
+
+        1. Tools assíncronas são aguardadas diretamente.
+        2. Tools síncronas rodam em uma thread de um pool dedicado (`_executor_tools`).
+        3. Um único prazo (`timeout_segundos`) cobre a chamada inteira. Se for excedido,
+           retorna uma mensagem de erro para o modelo em vez de travar a resposta.
+
+        Atenção: uma thread que excede o prazo NÃO é cancelada — ela continua rodando em
+        segundo plano até a tool síncrona terminar, ocupando um worker do pool dedicado.
+        Se `MAX_THREADS_TOOLS` threads ficarem presas, as chamadas seguintes esperam na
+        fila e essa espera conta para o prazo. Para limitar isso, configure também o
+        timeout do cliente HTTP usado pela tool, quando ele existir.
+
+        O nome, a assinatura e a docstring da função original são preservados
+        (functools.wraps), então o modelo vê a mesma tool.
+        """
+
+    @functools.wraps(funcao)
+    async def funcao_assincrona(*args: Any, **kwargs: Any) -> Any:
+        if inspect.iscoroutinefunction(funcao):
+            chamada = funcao(*args, **kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            chamada = loop.run_in_executor(_executor_tools, functools.partial(funcao, *args, **kwargs))
+
+        try:
+            return await asyncio.wait_for(chamada, timeout=timeout_segundos)
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool '{funcao.__name__}' excedeu o tempo limite de {timeout_segundos}s.")
+            return f"Erro: a ferramenta '{funcao.__name__}' excedeu o tempo limite de {timeout_segundos} segundos."
+
+    return funcao_assincrona
+
+
+def tornar_toolkit_assincrono(toolkit: Toolkit, timeout_segundos: float) -> Toolkit:
+    """
+        Troca o entrypoint de cada tool registrada no toolkit pela sua variante assíncrona.
+
+        O paralelismo vem do próprio `agent.arun()`, que já executa as chamadas de um
+        mesmo turno com asyncio.gather; esta troca acrescenta o tempo limite por chamada.
+        Os nomes das tools não mudam.
+
+        Deve ser chamado antes de o toolkit ser usado pelo agente (o Agno processa o
+        entrypoint na primeira execução). Agentes assim configurados devem usar
+        `agent.arun()`: `agent.run()` não executa entrypoints assíncronos.
+        """
+
+    for funcao in toolkit.functions.values():
+        if funcao.entrypoint is not None:
+            funcao.entrypoint = criar_versao_assincrona(funcao.entrypoint, timeout_segundos)
+
+    return toolkit